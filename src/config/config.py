@@ -30,3 +30,6 @@ class Config:
         # Dynamic performance monitoring settings
         self.lagThreshold = 0.05  # Tick time in seconds that indicates lag (50ms)
         self.performanceWindow = 10  # Number of recent ticks to analyze for performance
+        # Let tick times move maxEntities; off makes a seeded run independent
+        # of how fast the machine running it is
+        self.adaptiveEntityLimits = True
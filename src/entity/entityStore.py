@@ -0,0 +1,141 @@
+# Copyright (c) 2022 Daniel McCoy Stephenson
+# Apache License 2.0
+import numpy as np
+
+# Every numeric per-entity field, stored as one contiguous array per field so
+# a tick can work on whole columns instead of visiting each entity object.
+IDENTITY_COLUMNS = (("entityId", np.int64),)
+TRAIT_COLUMNS = (
+    ("health", np.int64),
+    ("maxHealth", np.int64),
+    ("chanceToFight", np.int64),
+    ("chanceToBefriend", np.int64),
+    ("damageReduction", np.float64),
+)
+STATS_COLUMNS = (
+    ("numOffspring", np.int64),
+    ("numCreaturesEaten", np.int64),
+    ("numFriendshipsForged", np.int64),
+    ("numActionsTaken", np.int64),
+)
+COLUMNS = IDENTITY_COLUMNS + TRAIT_COLUMNS + STATS_COLUMNS
+COLUMN_NAMES = tuple(name for name, _ in COLUMNS)
+
+DEFAULT_CAPACITY = 64
+
+
+# @author Daniel McCoy Stephenson
+class EntityStore(object):
+    """Struct-of-arrays storage for the numeric state of a set of entities.
+
+    Row i of every column belongs to entities[i], so the row order is the
+    entity order. Entities are handles that hold (store, row) and read their
+    fields through it; the store keeps those rows up to date as entities are
+    inserted and removed. An entity that is not in a world owns a private
+    one-row store, which is how it keeps its state while detached.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.entities = []
+        self.capacity = max(1, capacity)
+        for name, dtype in COLUMNS:
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+
+    def __len__(self):
+        return len(self.entities)
+
+    def getColumn(self, name):
+        """A writable view of a column, trimmed to the live rows"""
+        return getattr(self, name)[: len(self.entities)]
+
+    def reserve(self, capacity):
+        """Grow every column to hold at least capacity rows"""
+        if capacity <= self.capacity:
+            return
+        newCapacity = max(capacity, self.capacity * 2)
+        for name, dtype in COLUMNS:
+            column = np.zeros(newCapacity, dtype=dtype)
+            column[: self.capacity] = getattr(self, name)
+            setattr(self, name, column)
+        self.capacity = newCapacity
+
+    def allocate(self, entity):
+        """Give a newly constructed entity a zeroed row at the end"""
+        size = len(self.entities)
+        self.reserve(size + 1)
+        for name in COLUMN_NAMES:
+            getattr(self, name)[size] = 0
+        self.entities.append(entity)
+        entity._store = self
+        entity._row = size
+
+    def adopt(self, entity, index=None):
+        """Move an entity's row into this store, at the end or at index.
+
+        The entity keeps its current values; only where they live changes.
+        An entity already in this store keeps the row it has.
+        """
+        source, sourceRow = entity._store, entity._row
+        if source is self:
+            return
+        size = len(self.entities)
+        if index is None or index >= size:
+            index = size
+        self.reserve(size + 1)
+        for name in COLUMN_NAMES:
+            column = getattr(self, name)
+            if index < size:
+                column[index + 1 : size + 1] = column[index:size]
+            column[index] = getattr(source, name)[sourceRow]
+        self.entities.insert(index, entity)
+        entity._store = self
+        entity._row = index
+        if index < size:
+            self.reindex(index + 1)
+
+    def release(self, entity):
+        """Give an entity a private row holding a copy of its values"""
+        private = EntityStore(1)
+        private.adopt(entity)
+
+    def remove(self, entities):
+        """Remove a batch of entities in one compaction pass.
+
+        Removed entities are released onto private rows so that their final
+        state (a dead creature's health, say) can still be read.
+        """
+        size = len(self.entities)
+        keep = np.ones(size, dtype=bool)
+        removed = []
+        for entity in entities:
+            if entity._store is self and keep[entity._row]:
+                keep[entity._row] = False
+                removed.append(entity)
+        if not removed:
+            return
+        for entity in removed:
+            self.release(entity)
+        newSize = size - len(removed)
+        for name in COLUMN_NAMES:
+            column = getattr(self, name)
+            column[:newSize] = column[:size][keep]
+        self.entities = [e for e, k in zip(self.entities, keep) if k]
+        self.reindex(0)
+
+    def reindex(self, start):
+        """Point each entity from start onwards back at its own row"""
+        entities = self.entities
+        for row in range(start, len(entities)):
+            entities[row]._row = row
+
+
+def columnProperty(name, cast):
+    """A property that reads and writes one column of the owner's row"""
+
+    def getter(self):
+        return cast(getattr(self._store, name)[self._row])
+
+    def setter(self, value):
+        getattr(self._store, name)[self._row] = value
+
+    return property(getter, setter)
@@ -2,6 +2,7 @@
 # Apache License 2.0
 import random
 from collections import deque
+from entity.entityStore import EntityStore, columnProperty
 from flags.flags import Flags
 from stats.stats import Stats
 
@@ -14,41 +15,61 @@ DEFAULT_LOG_MAX_SIZE = 50
 # @author Daniel McCoy Stephenson
 # @since 2017
 class LivingEntity(object):
+    # Numeric state lives in a columnar EntityStore; these read and write this
+    # entity's row of it. A world adopts the row when the entity is added.
+    entityId = columnProperty("entityId", int)
+    health = columnProperty("health", int)
+    maxHealth = columnProperty("maxHealth", int)
+    chanceToFight = columnProperty("chanceToFight", int)
+    chanceToBefriend = columnProperty("chanceToBefriend", int)
+    damageReduction = columnProperty("damageReduction", float)
+
+    @damageReduction.deleter
+    def damageReduction(self):
+        # Every entity has the column, so removing the reduction zeroes it
+        self.damageReduction = 0.0
+
     def __init__(self, name, maxLogSize=DEFAULT_LOG_MAX_SIZE):
+        EntityStore(1).allocate(self)
+        self.entityId = -1  # Assigned by the first world the entity joins
         self.name = name
-        self.chanceToFight = random.randint(45, 55)  # Back to normal values
-        self.chanceToBefriend = 100 - self.chanceToFight
-        self.health = random.randint(80, 120)  # Health between 80-120
-        self.maxHealth = self.health  # Track maximum health for potential future use
+        self.rollTraits(random.randint)
         # The deque's maxlen is the cap; storing it separately would recreate
         # the very duplication this parameter exists to remove.
         self.log = deque(["%s was created." % self.name], maxlen=maxLogSize)
-        self.friends = []
-        self.stats = Stats()
+        self.friends = set()  # Keyed by identity, so namesakes stay strangers
+        self.stats = Stats(self)
         self.flags = Flags()
         self.parents = []  # Track parent entities
         self.children = []  # Track child entities
 
+    def rollTraits(self, randint):
+        """Draw starting traits; randint(low, high) is inclusive like random.randint"""
+        self.chanceToFight = randint(45, 55)  # Back to normal values
+        self.chanceToBefriend = 100 - self.chanceToFight
+        self.health = randint(80, 120)  # Health between 80-120
+        self.maxHealth = self.health  # Track maximum health for potential future use
+
     def rollForMovement(self):
         if random.randint(1, 10) == 1:
             return True
         else:
             return False
 
-    def getNextAction(self, kreature):
-        self.decision = random.randint(0, 100)
+    def getNextAction(self, kreature, roll=None):
+        """Pick an action towards kreature; roll is the 0-100 decision roll"""
+        if roll is None:
+            roll = random.randint(0, 100)
+        self.decision = roll
         if self.decision <= self.chanceToFight:  # if fight
-            for i in self.friends:
-                if i.name == kreature.name:
-                    return "nothing"  # if creature is a friend, don't fight
+            if kreature in self.friends:
+                return "nothing"  # if creature is a friend, don't fight
             self.stats.numActionsTaken += 1
-            return "fight"  # if search comes up empty, fight
+            return "fight"
         elif self.chanceToFight < self.decision:  # if befriend
-            for i in self.friends:
-                if i.name == kreature.name:
-                    self.stats.numActionsTaken += 1
-                    return "love"  # if creature is a friend, have a baby
             self.stats.numActionsTaken += 1
+            if kreature in self.friends:
+                return "love"  # if creature is a friend, have a baby
             return "befriend"
 
     def reproduce(self, kreature):
@@ -66,7 +87,7 @@ class LivingEntity(object):
             if self.health > 0:
                 damage = random.randint(15, 25)  # Random damage between 15-25
                 # Apply damage reduction if target has it
-                if hasattr(kreature, 'damageReduction') and kreature.damageReduction > 0:
+                if kreature.damageReduction > 0:
                     damage = int(damage * (1 - kreature.damageReduction))
                     damage = max(damage, 1)  # Ensure at least 1 damage
                 
@@ -94,7 +115,7 @@ class LivingEntity(object):
             if kreature.health > 0:
                 damage = random.randint(15, 25)  # Random damage between 15-25
                 # Apply damage reduction if target has it
-                if hasattr(self, 'damageReduction') and self.damageReduction > 0:
+                if self.damageReduction > 0:
                     damage = int(damage * (1 - self.damageReduction))
                     damage = max(damage, 1)  # Ensure at least 1 damage
                 
@@ -117,12 +138,12 @@ class LivingEntity(object):
                     )
 
     def befriend(self, kreature):
+        if kreature in self.friends:
+            return  # already friends; a friendship is only forged once
         self.addLogEntry("%s made friends with %s!" % (self.name, kreature.name))
         kreature.addLogEntry("%s made friends with %s!" % (kreature.name, self.name))
-        self.friends.append(kreature)
-        kreature.friends.append(
-            self
-        )  # this should hopefully append this creature to kreature's friend list
+        self.friends.add(kreature)
+        kreature.friends.add(self)
         self.stats.numFriendshipsForged += 1
         kreature.stats.numFriendshipsForged += 1
 
@@ -0,0 +1,91 @@
+# Copyright (c) 2022 Daniel McCoy Stephenson
+# Apache License 2.0
+import argparse
+import json
+import sys
+from kreatures import Kreatures
+from config.config import Config
+
+CHILD_POLICIES = ("never", "first", "healthiest")
+
+
+# @author Daniel McCoy Stephenson
+class HeadlessKreatures(Kreatures):
+    """A Kreatures game that runs unattended, as fast as the CPU allows.
+
+    Everything the interactive game asks for comes from the constructor:
+    the creature's name, and which child (if any) to continue as when the
+    player's creature dies. Ticks do not sleep and nothing is printed.
+    """
+
+    def __init__(self, creatureName, childPolicy="first", seed=None, config=None):
+        if childPolicy not in CHILD_POLICIES:
+            raise ValueError(
+                "childPolicy must be one of %s, not %r"
+                % (", ".join(CHILD_POLICIES), childPolicy)
+            )
+        self.childPolicy = childPolicy
+        if config is None:
+            # A batch run should give the same result for the same seed on any
+            # machine, so tick times are recorded but do not move the limits
+            config = Config()
+            config.adaptiveEntityLimits = False
+        super().__init__(creatureName, seed, config)
+
+    def announce(self, message):
+        pass
+
+    def chooseChild(self, living_children):
+        if self.childPolicy == "first":
+            return living_children[0]
+        if self.childPolicy == "healthiest":
+            return max(living_children, key=lambda child: child.health)
+        return None
+
+    def runHeadless(self, ticks):
+        """Run up to ticks ticks, or until the player's line dies out"""
+        self.placePlayerCreature()
+        while self.tick < ticks:
+            if not self.playerCreature.isAlive() and not self.continueAsChild():
+                break
+            self.simulateTick()
+        return self.getSummary()
+
+
+def parseArguments(argv):
+    parser = argparse.ArgumentParser(
+        description="Run a Kreatures simulation without any prompts and "
+        "print a JSON summary."
+    )
+    parser.add_argument("--name", default="Kreature", help="the player's creature")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument("--ticks", type=int, default=1000, help="ticks to run")
+    parser.add_argument(
+        "--continue-as-child",
+        choices=CHILD_POLICIES,
+        default="first",
+        help="which child to continue as when the player's creature dies",
+    )
+    parser.add_argument(
+        "--adaptive-limits",
+        action="store_true",
+        help="let tick times adjust maxEntities, as the interactive game does",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    arguments = parseArguments(argv)
+
+    game = HeadlessKreatures(
+        arguments.name, arguments.continue_as_child, arguments.seed
+    )
+    game.config.adaptiveEntityLimits = arguments.adaptive_limits
+    summary = game.runHeadless(arguments.ticks)
+
+    json.dump(summary, sys.stdout)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
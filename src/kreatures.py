@@ -5,24 +5,34 @@ import os
 import random
 import time
 from world.world import World
+from world.fightEngine import FightEngine
 from entity.livingEntity import LivingEntity
 from config.config import Config
+from rng.counterRng import CounterRng, DECISION, GRACE, NAME, TRAITS
 
 
 # @author Daniel McCoy Stephenson
 class Kreatures:
-    def __init__(self):
+    def __init__(self, creatureName=None, seed=None, config=None):
         # Config comes first: every entity created from here on is given the
         # configured log cap, so the setting applies to the whole world.
-        self.config = Config()
-        self.environment = World(self.config.entityLogMaxSize)
+        self.config = config if config is not None else Config()
+        # The seed is all it takes to replay a run
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.environment = World(self.config.entityLogMaxSize, CounterRng(seed))
         self.names = self._load_names()
 
-        print("What would you like to name your kreature?")
-        self.creatureName = input("> ")
+        if creatureName is None:
+            print("What would you like to name your kreature?")
+            creatureName = input("> ")
+        self.creatureName = creatureName
         self.playerCreature = LivingEntity(
             self.creatureName, self.config.entityLogMaxSize
         )
+        self.playerCreature.entityId = self.environment.newEntityId()
+        self.environment.rollTraits(self.playerCreature)
 
         self.running = True
         self.tick = 0
@@ -67,15 +77,18 @@ class Kreatures:
             ]
 
     def initiateEntityActions(self):
-        entities_to_remove = []  # Track entities that die this turn
+        # Fights are queued as they are picked and resolved together below
+        fights = FightEngine(self.environment, self.tick)
+        rng = self.environment.rng
 
         for entity in self.environment.getEntities():
-            target = self.environment.getRandomEntity()
+            target = self.environment.getRandomEntity(self.tick, entity.entityId)
 
             if target == entity or target is None:
                 continue
 
-            decision = entity.getNextAction(target)
+            roll = rng.stream(self.tick, entity.entityId, DECISION).randint(0, 100)
+            decision = entity.getNextAction(target, roll)
 
             if decision == "nothing":
                 entity.addLogEntry(
@@ -92,8 +105,9 @@ class Kreatures:
                     if self.config.godMode:
                         continue
                     # During grace period, 85% chance to skip attacking the player
+                    graceRoll = rng.stream(self.tick, entity.entityId, GRACE)
                     if (self.tick < self.config.earlyGameGracePeriod and 
-                        random.randint(1, 100) <= 85):
+                        graceRoll.randint(1, 100) <= 85):
                         entity.addLogEntry(
                             "%s decided not to attack %s." % (entity.name, target.name)
                         )
@@ -101,17 +115,15 @@ class Kreatures:
                 
                 entity.increaseChanceToFight()
                 entity.decreaseChanceToBefriend()
-                entity.fight(target)
-                # Check if either entity died from the fight to the death
-                if not target.isAlive() and target not in entities_to_remove:
-                    entities_to_remove.append(target)
-                if not entity.isAlive() and entity not in entities_to_remove:
-                    entities_to_remove.append(entity)
+                fights.queue(entity, target)
             elif decision == "befriend":
                 entity.increaseChanceToBefriend()
                 entity.decreaseChanceToFight()
                 entity.befriend(target)
 
+        # Every fight is to the death, so each one leaves a casualty
+        entities_to_remove = fights.resolve()
+
         # Remove all entities that died this turn in a single O(n) pass
         # (avoids O(n) list.remove() per death, which is O(n*k) overall)
         self.environment.removeEntities(entities_to_remove)
@@ -123,10 +135,14 @@ class Kreatures:
         """Update player protection based on current tick"""
         if self.tick >= self.config.earlyGameGracePeriod:
             # Grace period has ended
-            if hasattr(self.playerCreature, 'damageReduction') and self.playerCreature.damageReduction > 0:
+            if self.playerCreature.damageReduction > 0:
                 self.playerCreature.damageReduction = 0
                 self.playerCreature.addLogEntry("%s's protection has worn off!" % self.playerCreature.name)
 
+    def announce(self, message):
+        """Report something the simulation did on its own, like culling"""
+        print(message)
+
     def managePopulation(self):
         """Manage entity population to prevent performance issues"""
         current_count = self.environment.getNumEntities()
@@ -139,7 +155,7 @@ class Kreatures:
             removed_entities = self.environment.cullWeakestEntities(target_count, self.playerCreature)
             
             if removed_entities:
-                print(f"Population management: Removed {len(removed_entities)} weak entities (Population: {current_count} -> {self.environment.getNumEntities()})")
+                self.announce(f"Population management: Removed {len(removed_entities)} weak entities (Population: {current_count} -> {self.environment.getNumEntities()})")
 
     def canCreateNewEntity(self):
         """Check if we can create a new entity without exceeding limits"""
@@ -147,20 +163,26 @@ class Kreatures:
 
     def regenerateAllEntities(self):
         """Regenerate health for all living entities"""
-        for entity in self.environment.getEntities():
-            if entity.isAlive():
-                entity.regenerateHealth()
+        self.environment.regenerateEntities(self.tick)
 
     def createEntity(self):
         if not self.canCreateNewEntity():
             return None
+        entityId = self.environment.newEntityId()
         newEntity = LivingEntity(
-            self.names[random.randint(0, len(self.names) - 1)],
+            self.names[self.drawNameIndex(entityId)],
             self.config.entityLogMaxSize,
         )
+        newEntity.entityId = entityId
+        self.environment.rollTraits(newEntity, self.tick)
         self.environment.addEntity(newEntity)
         return newEntity
 
+    def drawNameIndex(self, entityId):
+        """Pick the name for the entity that will get entityId"""
+        randint = self.environment.rng.stream(self.tick, entityId, NAME).randint
+        return randint(0, len(self.names) - 1)
+
     def createChildEntity(self, parent1, parent2):
         """Create a child entity with proper parent-child relationships"""
         if not self.canCreateNewEntity():
@@ -169,8 +191,10 @@ class Kreatures:
             parent2.addLogEntry(f"{parent1.name} and {parent2.name} tried to have a child, but the world is too crowded!")
             return None
             
-        childName = self.names[random.randint(0, len(self.names) - 1)]
+        childId = self.environment.newEntityId()
+        childName = self.names[self.drawNameIndex(childId)]
         child = LivingEntity(childName, self.config.entityLogMaxSize)
+        child.entityId = childId
 
         # Set up parent-child relationships
         child.addParent(parent1)
@@ -184,7 +208,8 @@ class Kreatures:
 
         # Child inherits health traits from parents (average with some variation)
         parentHealthAvg = (parent1.maxHealth + parent2.maxHealth) // 2
-        child.health = parentHealthAvg + random.randint(-10, 10)  # Add some variation
+        variation = self.environment.rng.stream(self.tick, childId, TRAITS)
+        child.health = parentHealthAvg + variation.randint(-10, 10)  # Add some variation
         child.maxHealth = child.health
 
         child.addLogEntry(
@@ -209,45 +234,52 @@ class Kreatures:
         if not living_children:
             return False
 
+        new_player = self.chooseChild(living_children)
+        if new_player is None:
+            return False
+
+        # Update the player creature reference
+        self.playerCreature = new_player
+        # Make sure the new player creature is at position 0 in the entities list
+        if new_player in self.environment.entities:
+            self.environment.removeEntity(new_player)
+        self.environment.insertEntity(0, new_player)
+        self.running = True  # Continue the game
+        return True
+
+    def chooseChild(self, living_children):
+        """Ask the player which living child to continue as, or None to stop"""
         print(
             f"\n{self.playerCreature.name} has died, but has {len(living_children)} living children!"
         )
         print("Would you like to continue as one of your children? (y/n)")
         choice = input("> ").lower().strip()
 
-        if choice == "y" or choice == "yes":
-            if len(living_children) == 1:
-                # Only one child, automatically select it
-                new_player = living_children[0]
-                print(f"You are now playing as {new_player.name}!")
-            else:
-                # Multiple children, let player choose
-                print("\nWhich child would you like to continue as?")
-                for i, child in enumerate(living_children):
-                    print(f"{i+1}. {child.name}")
-
-                while True:
-                    try:
-                        choice_idx = int(input("> ")) - 1
-                        if 0 <= choice_idx < len(living_children):
-                            new_player = living_children[choice_idx]
-                            print(f"You are now playing as {new_player.name}!")
-                            break
-                        else:
-                            print("Invalid choice. Please try again.")
-                    except ValueError:
-                        print("Please enter a number.")
-
-            # Update the player creature reference
-            self.playerCreature = new_player
-            # Make sure the new player creature is at position 0 in the entities list
-            if new_player in self.environment.entities:
-                self.environment.entities.remove(new_player)
-            self.environment.entities.insert(0, new_player)
-            self.running = True  # Continue the game
-            return True
-
-        return False
+        if choice != "y" and choice != "yes":
+            return None
+
+        if len(living_children) == 1:
+            # Only one child, automatically select it
+            new_player = living_children[0]
+            print(f"You are now playing as {new_player.name}!")
+            return new_player
+
+        # Multiple children, let player choose
+        print("\nWhich child would you like to continue as?")
+        for i, child in enumerate(living_children):
+            print(f"{i+1}. {child.name}")
+
+        while True:
+            try:
+                choice_idx = int(input("> ")) - 1
+                if 0 <= choice_idx < len(living_children):
+                    new_player = living_children[choice_idx]
+                    print(f"You are now playing as {new_player.name}!")
+                    return new_player
+                else:
+                    print("Invalid choice. Please try again.")
+            except ValueError:
+                print("Please enter a number.")
 
     def monitorPerformance(self, tick_duration):
         """Monitor tick performance and adjust max entities dynamically"""
@@ -259,7 +291,7 @@ class Kreatures:
             self.tickTimes = self.tickTimes[-self.config.performanceWindow:]
         
         # Only adjust after we have some data
-        if len(self.tickTimes) >= 5:
+        if self.config.adaptiveEntityLimits and len(self.tickTimes) >= 5:
             self.adjustMaxEntitiesBasedOnLag(self.getAverageTickTime())
 
     def getAverageTickTime(self):
@@ -277,13 +309,41 @@ class Kreatures:
             new_max = max(self.config.minEntities, int(current_max * 0.8))
             if new_max != current_max:
                 self.config.maxEntities = new_max
-                print(f"Performance lag detected (avg: {avg_tick_time:.3f}s). Reducing max entities to {new_max}")
+                self.announce(f"Performance lag detected (avg: {avg_tick_time:.3f}s). Reducing max entities to {new_max}")
         elif avg_tick_time < self.config.lagThreshold * 0.5:
             # Performance is good, cautiously increase max entities
             new_max = min(self.config.maxEntitiesLimit, int(current_max * 1.1))
             if new_max != current_max and self.environment.getNumEntities() > current_max * 0.8:
                 self.config.maxEntities = new_max
-                print(f"Good performance (avg: {avg_tick_time:.3f}s). Increasing max entities to {new_max}")
+                self.announce(f"Good performance (avg: {avg_tick_time:.3f}s). Increasing max entities to {new_max}")
+
+    def getSummary(self):
+        """The facts printSummary and printStats report, as a plain dict"""
+        player = self.playerCreature
+        if player.chanceToFight > player.chanceToBefriend:
+            temperament = "ferocious"
+        elif player.chanceToBefriend > player.chanceToFight:
+            temperament = "friendly"
+        else:
+            temperament = "neutral"
+        return {
+            "seed": self.seed,
+            "name": player.name,
+            "temperament": temperament,
+            "chanceToFight": player.chanceToFight,
+            "chanceToBefriend": player.chanceToBefriend,
+            "damageReduction": player.damageReduction,
+            "alive": player.isAlive(),
+            "health": player.health,
+            "maxHealth": player.maxHealth,
+            "population": self.environment.getNumEntities(),
+            "ticks": self.tick,
+            "averageTickTime": self.getAverageTickTime(),
+            "maxEntities": self.config.maxEntities,
+            "friendshipsForged": player.stats.numFriendshipsForged,
+            "offspring": player.stats.numOffspring,
+            "creaturesEaten": player.stats.numCreaturesEaten,
+        }
 
     def printSummary(self):
         print("=== Summary ===")
@@ -303,7 +363,7 @@ class Kreatures:
         )
         
         # Show protection status
-        if hasattr(self.playerCreature, 'damageReduction') and self.playerCreature.damageReduction > 0:
+        if self.playerCreature.damageReduction > 0:
             protection_percent = int(self.playerCreature.damageReduction * 100)
             print("%s still has %d%% damage reduction." % (self.playerCreature.name, protection_percent))
         
@@ -340,7 +400,24 @@ class Kreatures:
         string is gone, so overwriting index 0 would silently delete the first
         starter creature (Alison) from the world.
         """
-        self.environment.entities.insert(0, self.playerCreature)
+        self.environment.insertEntity(0, self.playerCreature)
+
+    def simulateTick(self):
+        """Advance the world by one tick and feed its duration to the lag monitor"""
+        # Monitor performance and run simulation tick
+        tick_start_time = time.time()
+
+        self.initiateEntityActions()
+        self.updatePlayerProtection()  # Update player protection status
+        self.regenerateAllEntities()  # Regenerate health for all entities
+
+        tick_end_time = time.time()
+        tick_duration = tick_end_time - tick_start_time
+
+        # Track performance and adjust entity limits dynamically
+        self.monitorPerformance(tick_duration)
+
+        self.tick += 1
 
     def run(self):
         self.placePlayerCreature()
@@ -360,21 +437,8 @@ class Kreatures:
             except:  # if list is empty, just keep going
                 pass
 
-            # Monitor performance and run simulation tick
-            tick_start_time = time.time()
-            
-            self.initiateEntityActions()
-            self.updatePlayerProtection()  # Update player protection status
-            self.regenerateAllEntities()  # Regenerate health for all entities
-            
-            tick_end_time = time.time()
-            tick_duration = tick_end_time - tick_start_time
-            
-            # Track performance and adjust entity limits dynamically
-            self.monitorPerformance(tick_duration)
-            
+            self.simulateTick()
             time.sleep(self.config.tickLength)
-            self.tick += 1
             if self.tick >= self.config.maxTicks:
                 print("Maximum iterations reached.")
                 self.running = False
@@ -0,0 +1,209 @@
+# Copyright (c) 2022 Daniel McCoy Stephenson
+# Apache License 2.0
+import argparse
+import json
+import math
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from config.config import Config
+from headless import CHILD_POLICIES, HeadlessKreatures
+
+# The per-run numbers worth averaging across many worlds
+METRICS = (
+    "ticks",
+    "population",
+    "offspring",
+    "creaturesEaten",
+    "friendshipsForged",
+    "health",
+)
+
+
+def makeConfig(overrides):
+    """A default Config with the given attributes replaced"""
+    config = Config()
+    config.adaptiveEntityLimits = False
+    for name, value in overrides.items():
+        if not hasattr(config, name):
+            raise ValueError("Config has no setting called %r" % name)
+        setattr(config, name, value)
+    return config
+
+
+def runSimulation(seed, ticks, childPolicy="first", overrides=None):
+    """Run one seeded headless world and return its summary record"""
+    config = makeConfig(overrides or {})
+    game = HeadlessKreatures("Kreature", childPolicy, seed, config)
+    return game.runHeadless(ticks)
+
+
+# @author Daniel McCoy Stephenson
+class RunningStat(object):
+    """Count, mean, variance, min and max of a stream, in constant memory"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.sumOfSquares = 0.0  # Welford's M2
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.sumOfSquares += delta * (value - self.mean)
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def getStandardDeviation(self):
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.sumOfSquares / (self.count - 1))
+
+    def toDict(self):
+        return {
+            "mean": self.mean,
+            "stdev": self.getStandardDeviation(),
+            "min": self.minimum,
+            "max": self.maximum,
+        }
+
+
+# @author Daniel McCoy Stephenson
+class MonteCarloAggregate(object):
+    """Merges run records one at a time; nothing per-run is kept"""
+
+    def __init__(self):
+        self.runs = 0
+        self.survivors = 0
+        self.metrics = dict((name, RunningStat()) for name in METRICS)
+
+    def add(self, record):
+        self.runs += 1
+        if record["alive"]:
+            self.survivors += 1
+        for name, stat in self.metrics.items():
+            stat.add(record[name])
+
+    def toDict(self):
+        return {
+            "runs": self.runs,
+            "survivalRate": self.survivors / self.runs if self.runs else 0.0,
+            "metrics": dict(
+                (name, stat.toDict()) for name, stat in self.metrics.items()
+            ),
+        }
+
+
+def runMonteCarlo(
+    runs,
+    ticks,
+    baseSeed=0,
+    workers=None,
+    childPolicy="first",
+    overrides=None,
+    onRecord=None,
+):
+    """Run seeds baseSeed .. baseSeed+runs-1 over a process pool.
+
+    Only a few tasks per worker are in flight at once, and each finished
+    record goes to onRecord and into the aggregate before being dropped,
+    so memory does not grow with the number of runs.
+    """
+    workers = workers or os.cpu_count() or 1
+    aggregate = MonteCarloAggregate()
+    seeds = iter(range(baseSeed, baseSeed + runs))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        while True:
+            for seed in seeds:
+                pending.add(
+                    executor.submit(runSimulation, seed, ticks, childPolicy, overrides)
+                )
+                if len(pending) >= workers * 4:
+                    break
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                record = future.result()
+                aggregate.add(record)
+                if onRecord is not None:
+                    onRecord(record)
+    return aggregate
+
+
+def parseOverride(text):
+    """Turn name=value into (name, value), reading value as JSON if possible"""
+    name, separator, value = text.partition("=")
+    if not separator:
+        raise argparse.ArgumentTypeError("expected name=value, got %r" % text)
+    try:
+        return name, json.loads(value)
+    except ValueError:
+        return name, value
+
+
+def parseArguments(argv):
+    parser = argparse.ArgumentParser(
+        description="Run many seeded headless Kreatures worlds in parallel "
+        "and print aggregate statistics as JSON."
+    )
+    parser.add_argument("--runs", type=int, default=100, help="worlds to run")
+    parser.add_argument("--ticks", type=int, default=1000, help="ticks per world")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first run")
+    parser.add_argument("--workers", type=int, default=None, help="processes")
+    parser.add_argument(
+        "--continue-as-child", choices=CHILD_POLICIES, default="first"
+    )
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        type=parseOverride,
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="override a Config setting, e.g. --set earlyGameGracePeriod=80",
+    )
+    parser.add_argument(
+        "--records", default=None, help="also write every run's record as NDJSON"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    arguments = parseArguments(argv)
+    overrides = dict(arguments.overrides)
+    makeConfig(overrides)  # Reject unknown settings before starting workers
+
+    recordFile = open(arguments.records, "w") if arguments.records else None
+    try:
+        onRecord = None
+        if recordFile is not None:
+
+            def onRecord(record):
+                recordFile.write(json.dumps(record) + "\n")
+
+        aggregate = runMonteCarlo(
+            arguments.runs,
+            arguments.ticks,
+            arguments.seed,
+            arguments.workers,
+            arguments.continue_as_child,
+            overrides,
+            onRecord,
+        )
+    finally:
+        if recordFile is not None:
+            recordFile.close()
+
+    summary = aggregate.toDict()
+    summary["overrides"] = overrides
+    json.dump(summary, sys.stdout)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
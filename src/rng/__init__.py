@@ -0,0 +1,2 @@
+# Copyright (c) 2022 Daniel McCoy Stephenson
+# Apache License 2.0
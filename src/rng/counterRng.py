@@ -0,0 +1,86 @@
+# Copyright (c) 2022 Daniel McCoy Stephenson
+# Apache License 2.0
+import numpy as np
+
+# Independent streams, so that adding a draw to one part of a tick cannot
+# shift the numbers another part sees.
+TRAITS = 0
+NAME = 1
+TARGET = 2
+DECISION = 3
+GRACE = 4
+FIGHT = 5
+REGENERATION = 6
+MOVEMENT = 7
+
+MASK = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def mix(x):
+    """SplitMix64's finalizer on a Python int"""
+    x = (x + GOLDEN_GAMMA) & MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK
+    return x ^ (x >> 31)
+
+
+def mixArray(x):
+    """SplitMix64's finalizer on a uint64 array; products wrap mod 2**64"""
+    x = x + np.uint64(GOLDEN_GAMMA)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+# @author Daniel McCoy Stephenson
+class CounterRng(object):
+    """Counter-based random numbers: every draw is a hash of its key.
+
+    A draw is identified by (seed, tick, entity id, stream, draw index), and
+    its value depends on nothing else, in particular not on how many draws
+    came before it. The same run therefore gives the same results whether
+    entities are processed one at a time, as arrays, or on several workers.
+
+    Anything with the same integers() and stream() methods can stand in for
+    this class as a world's rng.
+    """
+
+    def __init__(self, seed):
+        self.seed = seed & MASK
+
+    def keyPrefix(self, tick, stream, draw):
+        return mix(mix(mix(mix(self.seed) ^ tick) ^ stream) ^ draw)
+
+    def bits(self, tick, entityIds, stream, draw=0):
+        """64 random bits for each entity id, as a uint64 array"""
+        ids = np.asarray(entityIds, dtype=np.int64).astype(np.uint64)
+        return mixArray(np.uint64(self.keyPrefix(tick, stream, draw)) ^ ids)
+
+    def integers(self, low, high, tick, entityIds, stream, draw=0):
+        """One integer in [low, high) for each entity id"""
+        bits = self.bits(tick, entityIds, stream, draw)
+        span = np.uint64(high - low)
+        return low + ((bits >> np.uint64(32)) * span >> np.uint64(32)).astype(np.int64)
+
+    def stream(self, tick, entityId, stream):
+        """Successive scalar draws for one entity, for per-entity code"""
+        return KeyedStream(self, tick, entityId, stream)
+
+
+# @author Daniel McCoy Stephenson
+class KeyedStream(object):
+    """The draws of one (tick, entity, stream) key, taken one after another"""
+
+    def __init__(self, rng, tick, entityId, stream):
+        self.rng = rng
+        self.tick = tick
+        self.entityId = entityId & MASK
+        self.stream = stream
+        self.draw = 0
+
+    def randint(self, low, high):
+        """An integer in [low, high], inclusive like random.randint"""
+        bits = mix(self.rng.keyPrefix(self.tick, self.stream, self.draw) ^ self.entityId)
+        self.draw += 1
+        return low + ((bits >> 32) * (high - low + 1) >> 32)
@@ -1,12 +1,25 @@
 # Copyright (c) 2022 Daniel McCoy Stephenson
 # Apache License 2.0
+from entity.entityStore import columnProperty
 
 
 # @author Daniel McCoy Stephenson
 # @since October 2nd, 2022
 class Stats(object):
-    def __init__(self):
-        self.numOffspring = 0
-        self.numCreaturesEaten = 0
-        self.numFriendshipsForged = 0
-        self.numActionsTaken = 0
+    """A view of the stats counters in its owner's row of the entity store"""
+
+    def __init__(self, owner):
+        self._owner = owner
+
+    @property
+    def _store(self):
+        return self._owner._store
+
+    @property
+    def _row(self):
+        return self._owner._row
+
+    numOffspring = columnProperty("numOffspring", int)
+    numCreaturesEaten = columnProperty("numCreaturesEaten", int)
+    numFriendshipsForged = columnProperty("numFriendshipsForged", int)
+    numActionsTaken = columnProperty("numActionsTaken", int)
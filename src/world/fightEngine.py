@@ -0,0 +1,152 @@
+# Copyright (c) 2022 Daniel McCoy Stephenson
+# Apache License 2.0
+import numpy as np
+from rng.counterRng import FIGHT
+
+
+def reduceDamage(damage, damageReduction):
+    """Apply each defender's damage reduction the way LivingEntity.fight does"""
+    reduced = np.maximum((damage * (1 - damageReduction)).astype(np.int64), 1)
+    return np.where(damageReduction > 0, reduced, damage)
+
+
+# @author Daniel McCoy Stephenson
+class FightEngine(object):
+    """Collects a tick's fights and resolves them together on the world's columns.
+
+    Every fight is to the death, exactly as in LivingEntity.fight: the
+    attacker strikes for 15-25, the defender strikes back if it survived,
+    and rounds repeat until one of them is eaten. Fights are grouped into
+    waves in which no entity appears twice, so a wave's rounds are plain
+    array operations. An entity's later fights land in later waves and see
+    the health its earlier fights left it with, just as they would if the
+    fights ran one after another.
+
+    Blows are drawn from the world's rng keyed by the tick, the attacker's
+    id and the round, so a fight's outcome does not depend on which wave it
+    landed in or on what else was fought this tick.
+    """
+
+    def __init__(self, world, tick=0):
+        self.world = world
+        self.tick = tick
+        self.pairs = []
+
+    def queue(self, attacker, defender):
+        self.pairs.append((attacker, defender))
+
+    def resolve(self):
+        """Resolve every queued fight and return the entities that died"""
+        store = self.world.store
+        fighters = []
+        waves = []
+        lastWave = {}
+        for attacker, defender in self.pairs:
+            fighters.append(attacker)
+            fighters.append(defender)
+            if attacker._store is not store or defender._store is not store:
+                # Only fighters that share the world's columns can be batched
+                attacker.fight(defender)
+                continue
+            wave = max(lastWave.get(attacker, -1), lastWave.get(defender, -1)) + 1
+            lastWave[attacker] = lastWave[defender] = wave
+            if wave == len(waves):
+                waves.append([])
+            waves[wave].append((attacker._row, defender._row))
+        self.pairs = []
+
+        for wave in waves:
+            rows = np.array(wave, dtype=np.int64)
+            self.resolveWave(rows[:, 0], rows[:, 1])
+
+        # Each fighter once, in the order they first fought
+        return [e for e in dict.fromkeys(fighters) if not e.isAlive()]
+
+    def resolveWave(self, attackers, defenders):
+        """Fight each attackers[i] against defenders[i] to the death"""
+        store = self.world.store
+        health = store.getColumn("health")
+        damageReduction = store.getColumn("damageReduction")
+        eaten = store.getColumn("numCreaturesEaten")
+
+        entityIds = store.getColumn("entityId")
+        rng = self.world.rng
+
+        fights = np.flatnonzero((health[attackers] > 0) & (health[defenders] > 0))
+        rounds = []
+        while fights.size:
+            attacking, defending = attackers[fights], defenders[fights]
+            draw = 2 * len(rounds)
+            blow = rng.integers(15, 26, self.tick, entityIds[attacking], FIGHT, draw)
+            counterBlow = rng.integers(
+                15, 26, self.tick, entityIds[attacking], FIGHT, draw + 1
+            )
+
+            damage = reduceDamage(blow, damageReduction[defending])
+            health[defending] -= damage
+            defenderDied = health[defending] <= 0
+
+            # Defenders that survived strike back
+            counter = reduceDamage(counterBlow, damageReduction[attacking])
+            counter[defenderDied] = 0
+            health[attacking] -= counter
+            attackerDied = ~defenderDied & (health[attacking] <= 0)
+
+            eaten[attacking[defenderDied]] += 1
+            eaten[defending[attackerDied]] += 1
+            rounds.append(
+                (
+                    fights,
+                    damage,
+                    counter,
+                    defenderDied,
+                    attackerDied,
+                    health[attacking],
+                    health[defending],
+                )
+            )
+            fights = fights[~(defenderDied | attackerDied)]
+
+        self.logRounds(attackers, defenders, rounds)
+
+    def logRounds(self, attackers, defenders, rounds):
+        """Write each round's log entries from both fighters' perspectives"""
+        entities = self.world.store.entities
+        for round in rounds:
+            fights, damage, counter, defenderDied, attackerDied = round[:5]
+            attackerHealth, defenderHealth = round[5:]
+            for i, fight in enumerate(fights):
+                attacker = entities[attackers[fight]]
+                defender = entities[defenders[fight]]
+                if defenderDied[i]:
+                    attacker.addLogEntry(
+                        "%s fought and ate %s!" % (attacker.name, defender.name)
+                    )
+                    defender.addLogEntry(
+                        "%s was eaten by %s!" % (defender.name, attacker.name)
+                    )
+                    continue
+                attacker.addLogEntry(
+                    "%s fought %s and dealt %d damage!"
+                    % (attacker.name, defender.name, damage[i])
+                )
+                defender.addLogEntry(
+                    "%s took %d damage from %s! Health: %d"
+                    % (defender.name, damage[i], attacker.name, defenderHealth[i])
+                )
+                if attackerDied[i]:
+                    defender.addLogEntry(
+                        "%s fought and ate %s!" % (defender.name, attacker.name)
+                    )
+                    attacker.addLogEntry(
+                        "%s was eaten by %s!" % (attacker.name, defender.name)
+                    )
+                else:
+                    defender.addLogEntry(
+                        "%s fought %s and dealt %d damage!"
+                        % (defender.name, attacker.name, counter[i])
+                    )
+                    attacker.addLogEntry(
+                        "%s took %d damage from %s! Health: %d"
+                        % (attacker.name, counter[i], defender.name, attackerHealth[i])
+                    )
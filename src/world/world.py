@@ -1,14 +1,25 @@
 # Copyright (c) 2022 Daniel McCoy Stephenson
 # Apache License 2.0
+from entity.entityStore import EntityStore
 from entity.livingEntity import LivingEntity, DEFAULT_LOG_MAX_SIZE
+from rng.counterRng import CounterRng, REGENERATION, TARGET, TRAITS
+import numpy as np
 import random
 
 
 # @author Daniel McCoy Stephenson
 # @since 2017
 class World(object):
-    def __init__(self, maxLogSize=DEFAULT_LOG_MAX_SIZE):
-        self.entities = []
+    def __init__(self, maxLogSize=DEFAULT_LOG_MAX_SIZE, rng=None):
+        # Entity order and numeric state both live in the columnar store
+        self.store = EntityStore()
+        # Every draw the simulation makes is keyed by tick and entity id.
+        # Without an explicit rng the seed comes from the random module, so
+        # random.seed() still pins down the whole run.
+        if rng is None:
+            rng = CounterRng(random.getrandbits(64))
+        self.rng = rng
+        self.nextEntityId = 0
 
         # create ten creatures for the world to have to start with
         self.Alison = LivingEntity("Alison", maxLogSize)
@@ -37,12 +48,42 @@ class World(object):
 
         for entity in self.starterEntities:
             self.addEntity(entity)
+            self.rollTraits(entity)
+
+    @property
+    def entities(self):
+        return self.store.entities
+
+    @entities.setter
+    def entities(self, entities):
+        self.store = EntityStore(len(entities))
+        for entity in entities:
+            self.addEntity(entity)
+
+    def newEntityId(self):
+        entityId = self.nextEntityId
+        self.nextEntityId += 1
+        return entityId
 
     def addEntity(self, entity):
-        self.entities.append(entity)
+        self.store.adopt(entity)
+        if entity.entityId < 0:
+            entity.entityId = self.newEntityId()
+
+    def rollTraits(self, entity, tick=0):
+        """Redraw an entity's starting traits from its own keyed stream"""
+        entity.rollTraits(self.rng.stream(tick, entity.entityId, TRAITS).randint)
+
+    def insertEntity(self, index, entity):
+        """Add an entity at a given position in the acting order"""
+        self.store.adopt(entity, index)
+        if entity.entityId < 0:
+            entity.entityId = self.newEntityId()
 
     def removeEntity(self, entity):
-        self.entities.remove(entity)
+        if entity._store is not self.store:
+            raise ValueError("%s is not in this world" % entity.name)
+        self.store.remove([entity])
 
     def removeEntities(self, entities):
         """Remove multiple entities in a single O(n) pass instead of one
@@ -51,8 +92,7 @@ class World(object):
         avoiding per-tick lag at high entity counts)."""
         if not entities:
             return
-        to_remove = set(entities)
-        self.entities = [e for e in self.entities if e not in to_remove]
+        self.store.remove(entities)
 
     def getNumEntities(self):
         return len(self.entities)
@@ -60,30 +100,72 @@ class World(object):
     def getEntities(self):
         return self.entities
 
-    def getRandomEntity(self):
+    def getRandomEntity(self, tick=0, entityId=0):
+        """Pick a target for the entity entityId to interact with this tick"""
         if len(self.entities) == 0:
             return None
-        return self.entities[random.randint(0, len(self.entities) - 1)]
+        randint = self.rng.stream(tick, entityId, TARGET).randint
+        return self.entities[randint(0, len(self.entities) - 1)]
+
+    def regenerateEntities(self, tick=0):
+        """Run LivingEntity.regenerateHealth for every living entity at once.
+
+        Each row gets the same 30% roll and 1-3 heal as the per-entity
+        version, drawn for every row in one array each; only the rows that
+        heal by 2 or more are visited to write their log entry. Returns the
+        number of entities that regenerated.
+        """
+        health = self.store.getColumn("health")
+        maxHealth = self.store.getColumn("maxHealth")
+        entityIds = self.store.getColumn("entityId")
+        rolls = self.rng.integers(1, 11, tick, entityIds, REGENERATION, 0)
+        regeneration = self.rng.integers(1, 4, tick, entityIds, REGENERATION, 1)
+
+        regenerating = (health > 0) & (health < maxHealth) & (rolls <= 3)
+        health[regenerating] = np.minimum(
+            health[regenerating] + regeneration[regenerating],
+            maxHealth[regenerating],
+        )
+
+        # Only log significant regeneration events to avoid spam
+        for row in np.flatnonzero(regenerating & (regeneration >= 2)):
+            entity = self.entities[row]
+            entity.addLogEntry(
+                "%s regenerated %d health! Health: %d/%d"
+                % (entity.name, regeneration[row], health[row], maxHealth[row])
+            )
+
+        return int(np.count_nonzero(regenerating))
 
     def cullWeakestEntities(self, targetCount, protectedEntity=None):
         """Remove the weakest entities to reduce population to targetCount"""
         if len(self.entities) <= targetCount:
             return []
         
-        # Create list of entities that can be culled (excluding protected entity)
-        cullable_entities = [e for e in self.entities if e != protectedEntity]
+        # Rows that can be culled (excluding protected entity)
+        cullable_rows = np.arange(len(self.entities))
+        if protectedEntity is not None and protectedEntity._store is self.store:
+            cullable_rows = np.delete(cullable_rows, protectedEntity._row)
 
-        if len(cullable_entities) == 0:
+        if len(cullable_rows) == 0:
             return []
 
         # Sort by health (weakest first), then by number of children (fewer children first)
-        cullable_entities.sort(key=lambda x: (x.health, len(x.children)))
+        health = self.store.getColumn("health")[cullable_rows]
+        numChildren = np.fromiter(
+            (len(self.entities[row].children) for row in cullable_rows),
+            dtype=np.int64,
+            count=len(cullable_rows),
+        )
+        order = np.lexsort((numChildren, health))
 
         # Calculate how many to remove
-        num_to_remove = min(len(self.entities) - targetCount, len(cullable_entities))
+        num_to_remove = min(len(self.entities) - targetCount, len(cullable_rows))
 
         # Remove the weakest entities in a single O(n) pass
-        removed_entities = cullable_entities[:num_to_remove]
+        removed_entities = [
+            self.entities[row] for row in cullable_rows[order[:num_to_remove]]
+        ]
         self.removeEntities(removed_entities)
 
         return removed_entities
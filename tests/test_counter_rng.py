@@ -0,0 +1,76 @@
+# Copyright (c) 2022 Daniel McCoy Stephenson
+# Apache License 2.0
+import sys
+import os
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from rng.counterRng import CounterRng, DECISION, FIGHT
+
+
+class TestCounterRng(unittest.TestCase):
+    """A draw depends on its key alone, never on the draws before it."""
+
+    def setUp(self):
+        self.rng = CounterRng(1234)
+
+    def test_the_same_key_always_gives_the_same_values(self):
+        first = self.rng.integers(0, 101, 5, np.arange(100), DECISION)
+        second = CounterRng(1234).integers(0, 101, 5, np.arange(100), DECISION)
+
+        np.testing.assert_array_equal(first, second)
+
+    def test_a_draw_does_not_depend_on_which_other_rows_are_drawn(self):
+        together = self.rng.integers(0, 101, 5, np.arange(100), DECISION)
+        reversed_ = self.rng.integers(0, 101, 5, np.arange(100)[::-1], DECISION)
+        alone = self.rng.integers(0, 101, 5, [42], DECISION)
+
+        np.testing.assert_array_equal(together, reversed_[::-1])
+        self.assertEqual(together[42], alone[0])
+
+    def test_scalar_streams_match_the_array_draws(self):
+        draws = self.rng.integers(15, 26, 3, np.arange(20), FIGHT, 4)
+
+        for entityId in range(20):
+            stream = self.rng.stream(3, entityId, FIGHT)
+            stream.draw = 4
+            self.assertEqual(stream.randint(15, 25), draws[entityId])
+
+    def test_successive_stream_draws_differ(self):
+        stream = self.rng.stream(0, 0, DECISION)
+
+        draws = [stream.randint(0, 10**9) for _ in range(10)]
+
+        self.assertEqual(len(set(draws)), 10)
+
+    def test_seeds_ticks_and_streams_are_independent(self):
+        ids = np.arange(1000)
+        base = self.rng.integers(0, 10**6, 0, ids, DECISION)
+
+        for other in (
+            CounterRng(1235).integers(0, 10**6, 0, ids, DECISION),
+            self.rng.integers(0, 10**6, 1, ids, DECISION),
+            self.rng.integers(0, 10**6, 0, ids, FIGHT),
+            self.rng.integers(0, 10**6, 0, ids, DECISION, 1),
+        ):
+            self.assertLess(np.count_nonzero(base == other), 5)
+
+    def test_values_cover_the_range_evenly(self):
+        draws = self.rng.integers(1, 11, 0, np.arange(100000), DECISION)
+
+        counts = np.bincount(draws, minlength=11)[1:]
+        self.assertEqual(draws.min(), 1)
+        self.assertEqual(draws.max(), 10)
+        self.assertTrue(np.all(np.abs(counts - 10000) < 500))
+
+    def test_negative_ids_are_valid_keys(self):
+        draws = self.rng.integers(0, 100, 0, [-1], DECISION)
+
+        self.assertEqual(self.rng.stream(0, -1, DECISION).randint(0, 99), draws[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+# Copyright (c) 2022 Daniel McCoy Stephenson
+# Apache License 2.0
+import sys
+import os
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from entity.entityStore import EntityStore
+from entity.livingEntity import LivingEntity
+from world.world import World
+
+
+class TestEntityStoreRows(unittest.TestCase):
+    """Entities are handles onto rows of their world's columns."""
+
+    def setUp(self):
+        self.world = World()
+        self.world.entities = []
+        self.first = LivingEntity("Alison")
+        self.second = LivingEntity("Barry")
+        self.world.addEntity(self.first)
+        self.world.addEntity(self.second)
+
+    def test_a_detached_entity_owns_a_private_row(self):
+        entity = LivingEntity("Conrad")
+
+        self.assertEqual(len(entity._store), 1)
+        self.assertIs(entity._store.entities[0], entity)
+
+    def test_adding_to_a_world_keeps_the_entitys_values(self):
+        entity = LivingEntity("Conrad")
+        entity.health = 42
+        entity.stats.numOffspring = 3
+
+        self.world.addEntity(entity)
+
+        self.assertIs(entity._store, self.world.store)
+        self.assertEqual(entity.health, 42)
+        self.assertEqual(entity.stats.numOffspring, 3)
+
+    def test_writes_through_a_handle_land_in_the_world_column(self):
+        self.second.health = 7
+        self.second.stats.numCreaturesEaten = 2
+
+        self.assertEqual(self.world.store.getColumn("health")[1], 7)
+        self.assertEqual(self.world.store.getColumn("numCreaturesEaten")[1], 2)
+
+    def test_column_writes_are_seen_by_the_handles(self):
+        self.world.store.getColumn("health")[:] = 5
+
+        self.assertEqual(self.first.health, 5)
+        self.assertEqual(self.second.health, 5)
+
+    def test_removal_compacts_rows_and_keeps_the_removed_state(self):
+        third = LivingEntity("Conrad")
+        self.world.addEntity(third)
+        self.first.health = 0
+        third.health = 33
+
+        self.world.removeEntities([self.first])
+
+        self.assertEqual(self.world.getEntities(), [self.second, third])
+        self.assertEqual((self.second._row, third._row), (0, 1))
+        self.assertEqual(third.health, 33)
+        self.assertIsNot(self.first._store, self.world.store)
+        self.assertEqual(self.first.health, 0)
+
+    def test_inserting_at_the_front_shifts_every_row(self):
+        player = LivingEntity("Player")
+        player.health = 1
+
+        self.world.insertEntity(0, player)
+
+        self.assertEqual(self.world.getEntities()[0], player)
+        self.assertEqual(self.world.store.getColumn("health")[0], 1)
+        self.assertEqual(
+            [e._row for e in self.world.getEntities()], [0, 1, 2]
+        )
+
+    def test_adding_an_entity_twice_keeps_a_single_row(self):
+        self.world.addEntity(self.first)
+
+        self.assertEqual(self.world.getNumEntities(), 2)
+
+    def test_removing_an_entity_from_another_world_is_an_error(self):
+        with self.assertRaises(ValueError):
+            self.world.removeEntity(LivingEntity("Stranger"))
+
+    def test_columns_grow_past_their_initial_capacity(self):
+        store = EntityStore(2)
+        for i in range(10):
+            entity = LivingEntity("Entity%d" % i)
+            entity.health = i
+            store.adopt(entity)
+
+        self.assertEqual(list(store.getColumn("health")), list(range(10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+# Copyright (c) 2022 Daniel McCoy Stephenson
+# Apache License 2.0
+import sys
+import os
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import headless
+from headless import HeadlessKreatures
+from entity.livingEntity import LivingEntity
+
+
+def runSeeded(seed, ticks=200, childPolicy="first"):
+    game = HeadlessKreatures("Batch", childPolicy, seed)
+    return game, game.runHeadless(ticks)
+
+
+class TestHeadlessKreatures(unittest.TestCase):
+    """Headless runs never prompt, never sleep and never print."""
+
+    def test_a_run_needs_no_input_sleep_or_output(self):
+        with patch("builtins.input") as mockInput, patch(
+            "kreatures.time.sleep"
+        ) as mockSleep, patch("builtins.print") as mockPrint:
+            runSeeded(1)
+
+        mockInput.assert_not_called()
+        mockSleep.assert_not_called()
+        mockPrint.assert_not_called()
+
+    def test_the_same_seed_gives_the_same_summary(self):
+        _, first = runSeeded(7)
+        _, second = runSeeded(7)
+
+        first.pop("averageTickTime")
+        second.pop("averageTickTime")
+        self.assertEqual(first, second)
+
+    def test_the_run_stops_at_the_requested_tick_count(self):
+        game = HeadlessKreatures("Batch")
+        game.playerCreature.health = game.playerCreature.maxHealth = 10**9
+
+        summary = game.runHeadless(5)
+
+        self.assertEqual(summary["ticks"], 5)
+        self.assertTrue(summary["alive"])
+
+    def test_the_never_policy_declines_to_continue(self):
+        game = HeadlessKreatures("Batch", "never")
+        game.playerCreature.addChild(game.environment.getEntities()[0])
+
+        self.assertFalse(game.continueAsChild())
+
+    def test_the_healthiest_policy_picks_the_strongest_living_child(self):
+        game = HeadlessKreatures("Batch", "healthiest")
+        weak, strong = game.environment.getEntities()[:2]
+        weak.health, strong.health = 10, 90
+        game.playerCreature.addChild(weak)
+        game.playerCreature.addChild(strong)
+
+        self.assertTrue(game.continueAsChild())
+        self.assertIs(game.playerCreature, strong)
+        self.assertIs(game.environment.getEntities()[0], strong)
+
+    def test_a_dead_player_is_replaced_before_the_next_tick(self):
+        game = HeadlessKreatures("Batch", "first")
+        child = LivingEntity("Child")
+        game.environment.addEntity(child)
+        game.playerCreature.addChild(child)
+        game.playerCreature.health = 0
+
+        game.runHeadless(1)
+
+        self.assertIs(game.playerCreature, child)
+
+    def test_an_unknown_child_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            HeadlessKreatures("Batch", "eldest")
+
+
+class TestHeadlessMain(unittest.TestCase):
+    """The command line prints one JSON summary line."""
+
+    def test_main_prints_a_json_summary(self):
+        output = io.StringIO()
+        with patch("sys.stdout", output):
+            headless.main(["--name", "Cli", "--seed", "3", "--ticks", "20"])
+
+        summary = json.loads(output.getvalue())
+        self.assertEqual(summary["seed"], 3)
+        self.assertLessEqual(summary["ticks"], 20)
+        for key in ("alive", "population", "offspring", "creaturesEaten"):
+            self.assertIn(key, summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
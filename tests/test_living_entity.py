@@ -35,7 +35,7 @@ class TestLivingEntityInitialization(unittest.TestCase):
     def test_relationship_collections_start_empty(self):
         entity = LivingEntity("Derrick")
 
-        self.assertEqual(entity.friends, [])
+        self.assertEqual(entity.friends, set())
         self.assertEqual(entity.parents, [])
         self.assertEqual(entity.children, [])
 
@@ -99,13 +99,13 @@ class TestGetNextAction(unittest.TestCase):
             self.assertEqual(self.entity.getNextAction(self.target), "befriend")
 
     def test_returns_nothing_for_a_friend_when_the_roll_is_low(self):
-        self.entity.friends.append(self.target)
+        self.entity.friends.add(self.target)
 
         with patch("entity.livingEntity.random.randint", return_value=10):
             self.assertEqual(self.entity.getNextAction(self.target), "nothing")
 
     def test_returns_love_for_a_friend_when_the_roll_is_high(self):
-        self.entity.friends.append(self.target)
+        self.entity.friends.add(self.target)
 
         with patch("entity.livingEntity.random.randint", return_value=90):
             self.assertEqual(self.entity.getNextAction(self.target), "love")
@@ -118,22 +118,20 @@ class TestGetNextAction(unittest.TestCase):
         with patch("entity.livingEntity.random.randint", return_value=51):
             self.assertEqual(self.entity.getNextAction(self.target), "befriend")
 
-    def test_friendship_is_matched_by_name_not_identity(self):
-        """A distinct creature that happens to share a friend's name is
-        currently treated as that friend. This locks in today's behavior; see
-        the discussion on issue #38 about whether identity matching is
-        intended instead."""
-        self.entity.friends.append(self.target)
+    def test_friendship_is_matched_by_identity_not_name(self):
+        """A distinct creature that happens to share a friend's name is a
+        stranger, not that friend."""
+        self.entity.friends.add(self.target)
         namesake = LivingEntity("Target")
 
         self.assertIsNot(namesake, self.target)
         with patch("entity.livingEntity.random.randint", return_value=90):
-            self.assertEqual(self.entity.getNextAction(namesake), "love")
+            self.assertEqual(self.entity.getNextAction(namesake), "befriend")
 
     def test_declining_to_fight_a_friend_does_not_count_as_an_action(self):
         """The "nothing" branch returns before numActionsTaken is touched,
         unlike every other branch."""
-        self.entity.friends.append(self.target)
+        self.entity.friends.add(self.target)
 
         with patch("entity.livingEntity.random.randint", return_value=10):
             self.entity.getNextAction(self.target)
@@ -146,7 +144,7 @@ class TestGetNextAction(unittest.TestCase):
             entity.chanceToFight = 50
             target = LivingEntity("Target")
             if friend:
-                entity.friends.append(target)
+                entity.friends.add(target)
 
             with patch("entity.livingEntity.random.randint", return_value=roll):
                 entity.getNextAction(target)
@@ -310,13 +308,16 @@ class TestBefriend(unittest.TestCase):
         self.assertEqual(self.entity.log[-1], "Alison made friends with Barry!")
         self.assertEqual(self.other.log[-1], "Barry made friends with Alison!")
 
-    def test_befriending_the_same_entity_twice_duplicates_the_entry(self):
-        """Nothing guards against a repeat friendship today."""
-        self.entity.befriend(self.other)
+    def test_befriending_the_same_entity_twice_is_a_no_op(self):
         self.entity.befriend(self.other)
+        entriesBefore = len(self.entity.log)
+        self.other.befriend(self.entity)
 
-        self.assertEqual(self.entity.friends.count(self.other), 2)
-        self.assertEqual(self.entity.stats.numFriendshipsForged, 2)
+        self.assertEqual(self.entity.friends, {self.other})
+        self.assertEqual(self.other.friends, {self.entity})
+        self.assertEqual(self.entity.stats.numFriendshipsForged, 1)
+        self.assertEqual(self.other.stats.numFriendshipsForged, 1)
+        self.assertEqual(len(self.entity.log), entriesBefore)
 
 
 class TestBehaviouralChanceAdjustments(unittest.TestCase):
@@ -0,0 +1,88 @@
+# Copyright (c) 2022 Daniel McCoy Stephenson
+# Apache License 2.0
+import sys
+import os
+import statistics
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from monteCarlo import (
+    MonteCarloAggregate,
+    RunningStat,
+    makeConfig,
+    runMonteCarlo,
+    runSimulation,
+)
+
+
+class TestRunningStat(unittest.TestCase):
+    """Streaming statistics agree with computing them over a kept list."""
+
+    def test_matches_the_statistics_module(self):
+        values = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+        stat = RunningStat()
+        for value in values:
+            stat.add(value)
+
+        self.assertAlmostEqual(stat.mean, statistics.mean(values))
+        self.assertAlmostEqual(stat.getStandardDeviation(), statistics.stdev(values))
+        self.assertEqual((stat.minimum, stat.maximum), (1, 9))
+
+    def test_a_single_value_has_no_spread(self):
+        stat = RunningStat()
+        stat.add(7)
+
+        self.assertEqual(stat.getStandardDeviation(), 0.0)
+
+
+class TestMonteCarloAggregate(unittest.TestCase):
+    def makeRecord(self, alive, ticks):
+        return {
+            "alive": alive,
+            "ticks": ticks,
+            "population": 1,
+            "offspring": 0,
+            "creaturesEaten": 0,
+            "friendshipsForged": 0,
+            "health": 10,
+        }
+
+    def test_survival_rate_and_means(self):
+        aggregate = MonteCarloAggregate()
+        aggregate.add(self.makeRecord(True, 100))
+        aggregate.add(self.makeRecord(False, 50))
+
+        summary = aggregate.toDict()
+        self.assertEqual(summary["runs"], 2)
+        self.assertEqual(summary["survivalRate"], 0.5)
+        self.assertEqual(summary["metrics"]["ticks"]["mean"], 75)
+
+
+class TestRunMonteCarlo(unittest.TestCase):
+    def test_every_seed_runs_once_and_matches_a_direct_run(self):
+        records = []
+
+        aggregate = runMonteCarlo(3, 20, baseSeed=10, workers=2, onRecord=records.append)
+
+        self.assertEqual(aggregate.runs, 3)
+        self.assertEqual(sorted(r["seed"] for r in records), [10, 11, 12])
+        for record in records:
+            direct = runSimulation(record["seed"], 20)
+            record.pop("averageTickTime")
+            direct.pop("averageTickTime")
+            self.assertEqual(record, direct)
+
+    def test_overrides_reach_the_config(self):
+        config = makeConfig({"playerDamageReduction": 0.9})
+
+        self.assertEqual(config.playerDamageReduction, 0.9)
+        self.assertEqual(runSimulation(1, 0, overrides={"playerDamageReduction": 0.9})["damageReduction"], 0.9)
+
+    def test_unknown_settings_are_rejected(self):
+        with self.assertRaises(ValueError):
+            makeConfig({"noSuchSetting": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -39,7 +39,7 @@ class TestPackageStructure(unittest.TestCase):
     def test_the_expected_packages_are_all_present(self):
         self.assertEqual(
             self.getPackageDirectories(),
-            ["config", "entity", "flags", "stats", "world"],
+            ["config", "entity", "flags", "rng", "stats", "world"],
         )
 
 
@@ -227,8 +227,10 @@ class TestGracePeriodMechanics:
                     # Set game to be in grace period
                     game.tick = 10  # Well within grace period
                     
-                    # Mock random to always trigger attack avoidance (return value <= 85)
-                    with patch('random.randint', return_value=50):  # 50 <= 85, so attack should be avoided
+                    # Mock the grace roll to always trigger attack avoidance (return value <= 85)
+                    roll = MagicMock()
+                    roll.randint.return_value = 50  # 50 <= 85, so attack should be avoided
+                    with patch.object(game.environment.rng, 'stream', return_value=roll):
                         initial_log_length = len(attacker.log)
                         game.initiateEntityActions()
                         
@@ -0,0 +1,203 @@
+# Copyright (c) 2022 Daniel McCoy Stephenson
+# Apache License 2.0
+import sys
+import os
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from entity.livingEntity import LivingEntity
+from world.world import World
+from world.fightEngine import FightEngine
+
+
+class FixedRng(object):
+    """Stands in for the world's generator and returns preset draws."""
+
+    def __init__(self, *draws):
+        self.draws = list(draws)
+
+    def integers(self, low, high, tick, entityIds, stream, draw=0):
+        values = self.draws.pop(0)
+        if np.isscalar(values):
+            return np.full(len(entityIds), values, dtype=np.int64)
+        return np.asarray(values)
+
+
+def makeWorld(*healths):
+    world = World()
+    world.entities = []
+    for i, health in enumerate(healths):
+        entity = LivingEntity("Entity%d" % i)
+        entity.maxHealth = 100
+        entity.health = health
+        world.addEntity(entity)
+    return world
+
+
+class TestRegenerateEntities(unittest.TestCase):
+    """The batched pass matches LivingEntity.regenerateHealth row by row."""
+
+    def test_successful_rolls_heal_by_the_rolled_amount(self):
+        world = makeWorld(90, 90)
+        world.rng = FixedRng([3, 4], [2, 3])
+
+        regenerated = world.regenerateEntities()
+
+        self.assertEqual([e.health for e in world.getEntities()], [92, 90])
+        self.assertEqual(regenerated, 1)
+
+    def test_regeneration_never_overshoots_maximum_health(self):
+        world = makeWorld(99)
+        world.rng = FixedRng([1], [3])
+
+        world.regenerateEntities()
+
+        self.assertEqual(world.getEntities()[0].health, 100)
+
+    def test_dead_and_fully_healed_entities_are_skipped(self):
+        world = makeWorld(0, 100)
+        world.rng = FixedRng([1, 1], [3, 3])
+
+        self.assertEqual(world.regenerateEntities(), 0)
+        self.assertEqual([e.health for e in world.getEntities()], [0, 100])
+
+    def test_only_regeneration_of_two_or_more_is_logged(self):
+        world = makeWorld(90, 90)
+        world.rng = FixedRng([1, 1], [2, 1])
+        quiet = world.getEntities()[1]
+        entriesBefore = len(quiet.log)
+
+        world.regenerateEntities()
+
+        self.assertEqual(
+            world.getEntities()[0].log[-1],
+            "Entity0 regenerated 2 health! Health: 92/100",
+        )
+        self.assertEqual(len(quiet.log), entriesBefore)
+
+    def test_real_draws_stay_within_bounds(self):
+        world = makeWorld(*range(1, 100))
+        before = [e.health for e in world.getEntities()]
+
+        world.regenerateEntities()
+
+        for entity, health in zip(world.getEntities(), before):
+            self.assertTrue(health <= entity.health <= min(health + 3, 100))
+
+    def test_an_empty_world_regenerates_nothing(self):
+        world = makeWorld()
+
+        self.assertEqual(world.regenerateEntities(), 0)
+
+
+class TestFightEngine(unittest.TestCase):
+    """Batched fights follow the same rules as LivingEntity.fight."""
+
+    def setUp(self):
+        self.world = makeWorld(100, 30, 100)
+        self.world.rng = FixedRng(*[20] * 20)
+        self.attacker, self.defender, self.bystander = self.world.getEntities()
+        self.fights = FightEngine(self.world)
+
+    def test_a_fight_runs_until_one_side_is_eaten(self):
+        self.fights.queue(self.attacker, self.defender)
+
+        casualties = self.fights.resolve()
+
+        self.assertEqual(casualties, [self.defender])
+        self.assertEqual(self.attacker.health, 80)
+        self.assertEqual(self.defender.health, -10)
+        self.assertEqual(self.attacker.stats.numCreaturesEaten, 1)
+        self.assertEqual(self.attacker.log[-1], "Entity0 fought and ate Entity1!")
+        self.assertEqual(self.defender.log[-1], "Entity1 was eaten by Entity0!")
+
+    def test_each_round_is_logged_from_both_sides(self):
+        self.fights.queue(self.attacker, self.defender)
+
+        self.fights.resolve()
+
+        self.assertIn(
+            "Entity0 fought Entity1 and dealt 20 damage!", list(self.attacker.log)
+        )
+        self.assertIn(
+            "Entity1 took 20 damage from Entity0! Health: 10",
+            list(self.defender.log),
+        )
+        self.assertIn(
+            "Entity0 took 20 damage from Entity1! Health: 80",
+            list(self.attacker.log),
+        )
+
+    def test_the_defender_can_win(self):
+        self.attacker.health = 30
+        self.defender.health = 100
+
+        self.fights.queue(self.attacker, self.defender)
+
+        self.assertEqual(self.fights.resolve(), [self.attacker])
+        self.assertEqual(self.defender.stats.numCreaturesEaten, 1)
+        self.assertEqual(self.defender.log[-1], "Entity1 fought and ate Entity0!")
+
+    def test_damage_reduction_is_applied_to_each_blow(self):
+        self.defender.damageReduction = 0.5
+
+        self.fights.queue(self.attacker, self.defender)
+        self.fights.resolve()
+
+        self.assertIn(
+            "Entity1 took 10 damage from Entity0! Health: 20",
+            list(self.defender.log),
+        )
+        self.assertEqual(self.defender.health, 0)
+
+    def test_reduced_damage_is_never_below_one(self):
+        self.bystander.damageReduction = 1.0
+        self.bystander.health = 2
+
+        self.fights.queue(self.attacker, self.bystander)
+        self.fights.resolve()
+
+        self.assertIn(
+            "Entity2 took 1 damage from Entity0! Health: 1",
+            list(self.bystander.log),
+        )
+        self.assertFalse(self.bystander.isAlive())
+
+    def test_a_second_fight_sees_the_first_fights_outcome(self):
+        self.fights.queue(self.attacker, self.defender)
+        self.fights.queue(self.bystander, self.defender)
+
+        casualties = self.fights.resolve()
+
+        # The defender was already eaten, so the bystander never fought
+        self.assertEqual(casualties, [self.defender])
+        self.assertEqual(self.bystander.health, 100)
+        self.assertEqual(self.bystander.stats.numCreaturesEaten, 0)
+
+    def test_fights_between_different_pairs_share_a_wave(self):
+        other = LivingEntity("Other")
+        other.health = 10
+        self.world.addEntity(other)
+        self.world.rng = FixedRng(*[20] * 4)
+
+        self.fights.queue(self.attacker, self.defender)
+        self.fights.queue(self.bystander, other)
+        casualties = self.fights.resolve()
+
+        self.assertEqual(casualties, [self.defender, other])
+        self.assertEqual(self.bystander.stats.numCreaturesEaten, 1)
+
+    def test_fighters_outside_the_world_fall_back_to_a_direct_fight(self):
+        stranger = LivingEntity("Stranger")
+        stranger.health = 1
+
+        self.fights.queue(self.attacker, stranger)
+
+        self.assertEqual(self.fights.resolve(), [stranger])
+
+
+if __name__ == "__main__":
+    unittest.main()